@@ -6,6 +6,7 @@ Test Fixtures:
 - make_ctx: Flexible factory for creating mock EmilyContext
   - Supports replies, DM contexts, custom author/guild
 - server_context: Pre-populated server with test data
+- js_executor: JavaScriptExecutor shared by the whole session
 
 Examples:
     # Basic context
@@ -37,6 +38,7 @@ from collections.abc import Callable, Generator
 
 from emilybot.database import DB, Entry
 from emilybot.discord import EmilyBot, EmilyContext
+from emilybot.execute.executor import JavaScriptExecutor
 from emilybot.test_utils import (
     AuthorConfig,
     GuildConfig,
@@ -62,6 +64,16 @@ def db() -> Generator[DB, Any, None]:
         yield db_instance
 
 
+@pytest.fixture(scope="session")
+def js_executor() -> JavaScriptExecutor:
+    """Create one JavaScript executor for all tests.
+
+    The executor holds no per-run state (every `execute` call spawns its own
+    Deno process), so sharing it only saves the repeated `deno` PATH lookup.
+    """
+    return JavaScriptExecutor()
+
+
 @pytest.fixture
 def server_context(
     db: DB, entry_factory: Callable[..., Entry]
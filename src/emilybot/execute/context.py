@@ -4,7 +4,7 @@ from dataclasses import dataclass, asdict
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CtxUser:
     id: str  # instead of 'int' because in JS it overflows 'number'
 
@@ -37,7 +37,7 @@ def create_test_user(**kwargs: Any) -> CtxUser:
     )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CtxServer:
     id: str
 
@@ -45,7 +45,7 @@ class CtxServer:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CtxReplyTo:
     user: CtxUser
     text: str
@@ -54,12 +54,12 @@ class CtxReplyTo:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CtxMessage:
     text: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Context:
     message: CtxMessage
     reply_to: CtxReplyTo | None
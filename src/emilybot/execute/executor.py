@@ -76,14 +76,15 @@ class JavaScriptExecutor:
         """
         try:
             # XXX: ctx left for backwards compatibility, will remove later
-            fields_json = json.dumps({**context.as_json(), "ctx": context.as_json()})
+            fields = context.as_json()
+            fields_json = json.dumps({**fields, "ctx": fields})
             commands_json = json.dumps(commands)
 
             DEBUG = os.getenv("DEBUG")
             with TemporaryDirectory(
                 delete=DEBUG != "1" and DEBUG != "true"
             ) as temp_dir:
-                logging.debug(f"Created temporary directory: {temp_dir}")
+                logging.debug("Created temporary directory: %s", temp_dir)
                 temp_path = Path(temp_dir)
                 fields_path = temp_path / "fields.json"
                 commands_path = temp_path / "commands.json"
@@ -115,7 +116,8 @@ class JavaScriptExecutor:
 
                 try:
                     logging.info("Starting Deno process")
-                    logging.debug(f"Deno command: {shlex.join(cmd)}")
+                    if logging.getLogger().isEnabledFor(logging.DEBUG):
+                        logging.debug("Deno command: %s", shlex.join(cmd))
                     stdout, stderr = await asyncio.wait_for(
                         process.communicate(), timeout=self.timeout
                     )
@@ -137,8 +139,8 @@ class JavaScriptExecutor:
             stdout_text = stdout.decode("utf-8").strip() if stdout else ""
             stderr_text = stderr.decode("utf-8").strip() if stderr else ""
 
-            logging.debug(f"Deno stderr: {stderr_text}")
-            logging.debug(f"Deno stdout: {stdout_text}")
+            logging.debug("Deno stderr: %s", stderr_text)
+            logging.debug("Deno stdout: %s", stdout_text)
 
             # Check exit code and classify errors
             if process.returncode == 0:
@@ -179,7 +181,7 @@ class JavaScriptExecutor:
             # Re-raise JSExecutionError as-is
             raise
         except Exception as e:
-            logging.error(f"Unexpected error in JavaScript execution: {e}")
+            logging.error("Unexpected error in JavaScript execution: %s", e)
             return False, f"❌ Unexpected execution error: {e}", None
 
     def _classify_error(self, stderr: str) -> str:
@@ -10,6 +10,13 @@ from emilybot.execute.javascript_executor import (
     CommandData,
 )
 
+_CONTEXT = Context(
+    message=CtxMessage(text="test message"),
+    reply_to=None,
+    user=create_test_user(id="123", name="TestUser"),
+    server=CtxServer(id="12345"),
+)
+
 
 def test_code_parsing():
     """Test the code parsing functionality."""
@@ -60,20 +67,11 @@ async def test_nested_commands_with_js_code():
         ),
     ]
 
-    test_context = Context(
-        message=CtxMessage(text="test message"),
-        reply_to=None,
-        user=create_test_user(id="123", name="TestUser"),
-        server=CtxServer(id="12345"),
-    )
-
     # Test calling $foo() - should execute the JS code
     test_code = "$foo()"
 
     try:
-        success, output, value = await executor.execute(
-            test_code, test_context, commands
-        )
+        success, output, value = await executor.execute(test_code, _CONTEXT, commands)
         assert success, f"$foo() execution failed: {output}"
         # Should see the console.log output and the return value
         assert "Executing foo JS code" in output, (
@@ -87,9 +85,7 @@ async def test_nested_commands_with_js_code():
     test_code = "$foo.bar()"
 
     try:
-        success, output, value = await executor.execute(
-            test_code, test_context, commands
-        )
+        success, output, value = await executor.execute(test_code, _CONTEXT, commands)
         assert success, f"$foo.bar() execution failed: {output}"
         # Should see the content displayed, not JS execution
         assert "This is the foo/bar command content" in output, (
@@ -102,9 +98,7 @@ async def test_nested_commands_with_js_code():
     test_code = "console.log('$foo type:', typeof $foo); console.log('$foo.bar type:', typeof $foo.bar);"
 
     try:
-        success, output, value = await executor.execute(
-            test_code, test_context, commands
-        )
+        success, output, value = await executor.execute(test_code, _CONTEXT, commands)
         assert success, f"Command type test failed: {output}"
         # Both should be functions
         assert "function" in output, f"Expected functions, got: {output}"
@@ -131,20 +125,11 @@ async def test_nested_commands_reverse_order():
         ),
     ]
 
-    test_context = Context(
-        message=CtxMessage(text="test message"),
-        reply_to=None,
-        user=create_test_user(id="123", name="TestUser"),
-        server=CtxServer(id="12345"),
-    )
-
     # Test calling $foo() - should execute the JS code
     test_code = "$foo()"
 
     try:
-        success, output, value = await executor.execute(
-            test_code, test_context, commands
-        )
+        success, output, value = await executor.execute(test_code, _CONTEXT, commands)
         assert success, f"$foo() execution (reverse order) failed: {output}"
         # Should see the console.log output and the return value
         assert "Executing foo JS code" in output, (
@@ -160,9 +145,7 @@ async def test_nested_commands_reverse_order():
     test_code = "$foo.bar()"
 
     try:
-        success, output, value = await executor.execute(
-            test_code, test_context, commands
-        )
+        success, output, value = await executor.execute(test_code, _CONTEXT, commands)
         assert success, f"$foo.bar() execution (reverse order) failed: {output}"
         # Should see the content displayed, not JS execution
         assert "This is the foo/bar command content" in output, (
@@ -177,9 +160,7 @@ async def test_nested_commands_reverse_order():
     test_code = "console.log('$foo type:', typeof $foo); console.log('$foo.bar type:', typeof $foo.bar);"
 
     try:
-        success, output, value = await executor.execute(
-            test_code, test_context, commands
-        )
+        success, output, value = await executor.execute(test_code, _CONTEXT, commands)
         assert success, f"Command type test (reverse order) failed: {output}"
         # Both should be functions
         assert "function" in output, f"Expected functions, got: {output}"
@@ -198,9 +179,7 @@ async def test_nested_commands_reverse_order():
     """
 
     try:
-        success, output, value = await executor.execute(
-            test_code, test_context, commands
-        )
+        success, output, value = await executor.execute(test_code, _CONTEXT, commands)
         assert success, f"Combined execution test (reverse order) failed: {output}"
         # Should see both commands working
         assert "Executing foo JS code" in output, (
@@ -222,15 +201,8 @@ async def test_javascript_execution():
 
     # Test simple console.log
     test_code = "console.log('Hello from JavaScript!');"
-    test_context = Context(
-        message=CtxMessage(text="test message"),
-        reply_to=None,
-        user=create_test_user(id="123", name="TestUser"),
-        server=CtxServer(id="12345"),
-    )
-
     try:
-        success, output, _value = await executor.execute(test_code, test_context, [])
+        success, output, _value = await executor.execute(test_code, _CONTEXT, [])
         assert success, f"JavaScript execution test failed: {output}"
         assert "Hello from JavaScript!" in output, f"Expected JS output, got: {output}"
     except Exception as e:
@@ -1,12 +1,17 @@
 import asyncio
+import functools
+import importlib
 import logging
 import os
 import discord
+import signal
 import sys
 import subprocess
 from pathlib import Path
+from types import ModuleType
 from typing import Any, Optional, assert_never
-from watchfiles import awatch  # type: ignore
+from discord.ext import commands
+from watchfiles import Change, DefaultFilter, awatch  # type: ignore
 
 from emilybot.discord import EmilyBot, EmilyContext
 from emilybot.commands.save import cmd_add
@@ -21,6 +26,143 @@ from emilybot.execute.run_code import run_code
 from emilybot.format import format_show_content
 from emilybot.parser import parse_message, Command, JS, ListChildren
 
+# Reactions that make the bot delete its own message
+# - Custom emoji: <:miss:1363721012801179779>
+# - Unicode: 🗑️ (wastebasket) and ❌ (x)
+_DELETION_EMOJIS = frozenset(
+    {
+        "1363721012801179779",  # Custom emoji ID (just the ID number)
+        "🗑️",  # Wastebasket
+        "❌",  # X mark
+    }
+)
+
+# Paths watched for changes in development mode
+_WATCH_PATHS = (Path("src/emilybot"), Path("."))
+
+
+class _ReloadFilter(DefaultFilter):
+    """Only let through file changes that should restart the bot.
+
+    Builds on watchfiles' `DefaultFilter`, which already skips `__pycache__`,
+    `.git`, `node_modules` and editor temp files, so `awatch` only yields
+    batches that are relevant.
+    """
+
+    def __call__(self, change: Change, path: str) -> bool:
+        return super().__call__(change, path) and _is_relevant_file(path)
+
+
+def _is_relevant_file(file_path: str) -> bool:
+    """Check if a file change should trigger a restart.
+
+    Called for every filesystem event, so this sticks to string operations
+    instead of building a `Path`.
+
+        >>> _is_relevant_file("src/emilybot/main.py")
+        True
+        >>> _is_relevant_file("config.toml")
+        True
+        >>> _is_relevant_file("src/emilybot/__pycache__/main.py")
+        False
+        >>> _is_relevant_file("src/emilybot/.main.py")
+        False
+        >>> _is_relevant_file("README.md")
+        False
+    """
+    name = os.path.basename(file_path)
+    return (
+        name.endswith(".py")
+        and "__pycache__" not in file_path
+        and not name.startswith(".")
+    ) or name == "config.toml"
+
+
+_COMMANDS_DIR = Path(__file__).resolve().parent / "commands"
+
+
+def _reload_command_modules(bot: EmilyBot, changed_files: list[str]) -> bool:
+    """Reload `emilybot.commands` modules in place and re-register their commands.
+
+    This keeps the gateway connection alive, unlike a full restart. Returns
+    False if anything other than a command module changed, or if a module
+    added, removed or renamed commands; the caller has to restart the process
+    then, since other modules are captured in closures and new commands have to
+    be registered by `init_bot`.
+    """
+    if not all(Path(f).resolve().parent == _COMMANDS_DIR for f in changed_files):
+        return False
+
+    # Command modules import helpers from each other (e.g. `run` uses `show`),
+    # so reload all of them, dependencies first
+    modules = [
+        module
+        for name, module in sys.modules.items()
+        if name.startswith("emilybot.commands.") and name.count(".") == 2
+    ]
+    for module in _dependencies_first(modules):
+        old_names = _command_names(module)
+        module = importlib.reload(module)
+        if _command_names(module) != old_names:
+            return False
+        for name, obj in vars(module).items():
+            if isinstance(obj, commands.Command) and bot.get_command(obj.name):
+                bot.remove_command(obj.name)
+                bot.add_command(obj)  # pyright: ignore[reportUnknownArgumentType]
+                # `on_message` calls some commands directly by their global name
+                if name in globals():
+                    globals()[name] = obj
+    return True
+
+
+def _command_names(module: ModuleType) -> set[str]:
+    """Names of the commands defined in a module."""
+    return {
+        obj.name for obj in vars(module).values() if isinstance(obj, commands.Command)
+    }
+
+
+def _dependencies_first(modules: list[ModuleType]) -> list[ModuleType]:
+    """Order modules so that each one comes after the modules it imports from."""
+    names = {module.__name__ for module in modules}
+    deps = {
+        module.__name__: {
+            getattr(obj, "__module__", None) for obj in vars(module).values()
+        }
+        & (names - {module.__name__})
+        for module in modules
+    }
+    ordered: list[ModuleType] = []
+    done: set[str] = set()
+    while len(ordered) < len(modules):
+        pending = [m for m in modules if m.__name__ not in done]
+        # Break import cycles by taking the remaining modules as they are
+        ready = [m for m in pending if deps[m.__name__] <= done] or pending
+        ordered += ready
+        done |= {m.__name__ for m in ready}
+    return ordered
+
+
+@functools.cache
+def _get_commit_info() -> str:
+    """Get the current commit for the startup notification.
+
+    Cached because `on_ready` fires again on every gateway reconnect.
+    """
+    try:
+        # Short hash on the first line, full commit message after it
+        output = subprocess.check_output(
+            ["git", "log", "-1", "--pretty=format:%h%n%B"],
+            text=True,
+            stderr=subprocess.DEVNULL,
+        )
+        commit_hash, _, commit_msg = output.partition("\n")
+        commit_msg = commit_msg.strip()
+        return f"**Commit:** `{commit_hash}`\n**Message:** {commit_msg}"
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        # Not in a git repo or git not available
+        return "*No git info available*"
+
 
 async def execute_js(ctx: EmilyContext, code: str) -> None:
     """Execute JavaScript. All wrapping like '$ ', '```js`, etc should be handled by the parser."""
@@ -46,6 +188,12 @@ async def init_bot(dev: bool) -> EmilyBot:
             "Running in production mode. Using `.` and `$` as command prefixes."
         )
         command_prefix = [".", "$"]
+    # Prefixes that `parse_message` accepts on top of `$`
+    extra_prefixes = [] if dev else ["."]
+    # Messages starting with anything else can't reach a handler: discord.py
+    # commands use `command_prefix`, and `parse_message` always accepts `$`
+    # (so the dev bot still answers plain `$foo` and `$ code`)
+    all_prefixes = ("$", *command_prefix, *extra_prefixes)
 
     bot = EmilyBot(
         command_prefix=command_prefix,
@@ -68,40 +216,30 @@ async def init_bot(dev: bool) -> EmilyBot:
     bot.add_command(cmd_run)
     bot.add_command(cmd_cmd)
 
+    # Set in `on_ready`, so that reaction events don't have to look it up
+    bot_user_id: Optional[int] = None
+
     @bot.listen()
     async def on_ready() -> None:  # pyright: ignore[reportUnusedFunction]
-        logging.info(f"We have logged in as {bot.user}")
+        nonlocal bot_user_id
+        bot_user_id = bot.user.id if bot.user else None
+        logging.info("We have logged in as %s", bot.user)
 
         # Send startup notification to availablegreen
         try:
-            # Get git commit info (skip if not in a git repo)
-            try:
-                commit_hash = subprocess.check_output(
-                    ["git", "rev-parse", "--short", "HEAD"],
-                    text=True,
-                    stderr=subprocess.DEVNULL,
-                ).strip()
-                commit_msg = subprocess.check_output(
-                    ["git", "log", "-1", "--pretty=%B"],
-                    text=True,
-                    stderr=subprocess.DEVNULL,
-                ).strip()
-                commit_info = f"**Commit:** `{commit_hash}`\n**Message:** {commit_msg}"
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                # Not in a git repo or git not available
-                commit_info = "*No git info available*"
+            commit_info = _get_commit_info()
 
             # Send DM to Ema
             try:
                 user = await bot.fetch_user(328950281570353153)  # Ema
                 await user.send(f"🚀 **Bot started!**\n\n{commit_info}")
-                logging.info(f"Sent startup notification to {user.name}")
+                logging.info("Sent startup notification to %s", user.name)
             except discord.NotFound:
                 logging.warning("Could not find Ema (ID: 328950281570353153)")
             except discord.Forbidden:
                 logging.warning("Cannot DM Ema (privacy settings)")
         except Exception as e:
-            logging.error(f"Failed to send startup notification: {e}")
+            logging.error("Failed to send startup notification: %s", e)
 
     @bot.listen()
     async def on_raw_reaction_add(  # pyright: ignore[reportUnusedFunction]
@@ -112,25 +250,14 @@ async def init_bot(dev: bool) -> EmilyBot:
         Uses raw events to work with both cached and uncached messages.
         """
         # Ignore bot reactions
-        if payload.user_id == bot.user.id:  # type: ignore
+        if payload.user_id == bot_user_id:
             return
 
-        # Define deletion emojis
-        # - Custom emoji: <:miss:1363721012801179779>
-        # - Unicode: 🗑️ (wastebasket) and ❌ (x)
-        deletion_emojis = {
-            "1363721012801179779",  # Custom emoji ID (just the ID number)
-            "🗑️",  # Wastebasket
-            "❌",  # X mark
-        }
-
-        # Check if the reaction emoji matches any deletion emoji
-        emoji_str = str(payload.emoji)
+        # Check if the reaction emoji matches any deletion emoji.
         # For custom emojis, use the ID
-        if payload.emoji.id:
-            emoji_str = str(payload.emoji.id)
-
-        if emoji_str not in deletion_emojis:
+        emoji_id = payload.emoji.id
+        emoji_str = str(emoji_id) if emoji_id else str(payload.emoji)
+        if emoji_str not in _DELETION_EMOJIS:
             return
 
         # Fetch the message to check if it's from the bot
@@ -150,17 +277,20 @@ async def init_bot(dev: bool) -> EmilyBot:
 
             await message.delete()
             logging.info(
-                f"Deleted message {message.id} after {emoji_str} reaction from user {payload.user_id}"
+                "Deleted message %s after %s reaction from user %s",
+                message.id,
+                emoji_str,
+                payload.user_id,
             )
         except discord.NotFound:
             # Message was already deleted
             pass
         except discord.Forbidden:
             logging.warning(
-                f"Cannot delete message {payload.message_id} - missing permissions"
+                "Cannot delete message %s - missing permissions", payload.message_id
             )
         except Exception as e:
-            logging.error(f"Error deleting message: {e}", exc_info=True)
+            logging.error("Error deleting message: %s", e, exc_info=True)
 
     async def on_message(message: discord.Message) -> None:
         """
@@ -170,6 +300,10 @@ async def init_bot(dev: bool) -> EmilyBot:
         if message.author.bot:
             return
 
+        # Most messages are plain conversation; skip building a context for them
+        if not message.content.startswith(all_prefixes):
+            return
+
         ctx = await bot.get_context(message)
         if ctx.command:
             await bot.invoke(ctx)
@@ -185,12 +319,12 @@ async def init_bot(dev: bool) -> EmilyBot:
             if dev and message_content.startswith("#$"):
                 message_content = message_content[1:]
 
-            parsed = parse_message(message_content, extra_prefixes=[] if dev else ["."])
+            parsed = parse_message(message_content, extra_prefixes=extra_prefixes)
 
             # Note: ctx.args doesn't give us args :(
             match parsed:
                 case Command(cmd=cmd, args=args):
-                    await cmd_cmd(ctx, cmd, args=args)
+                    await cmd_cmd(ctx, cmd, args=list(args))
                 case JS(code=code):
                     await execute_js(ctx, code)
                 case ListChildren(parent=parent):
@@ -217,17 +351,12 @@ async def run_bot_with_autoreload() -> None:
         print("❌ TOKEN is not set")
         sys.exit(1)
 
+    bot: Optional[EmilyBot] = None
     bot_task: Optional[asyncio.Task[Any]] = None
-    watch_paths = [Path("src/emilybot"), Path(".")]
 
     async def start_bot():
-        nonlocal bot_task
-        if bot_task and not bot_task.done():
-            bot_task.cancel()
-            try:
-                await bot_task
-            except asyncio.CancelledError:
-                pass
+        nonlocal bot, bot_task
+        await stop_bot()
 
         logging.info("🚀 Starting bot...")
         dev_mode = os.environ.get("DEV_MODE", "false").lower() == "true"
@@ -235,23 +364,21 @@ async def run_bot_with_autoreload() -> None:
         bot_task = asyncio.create_task(bot.start(TOKEN))
 
     async def stop_bot():
-        nonlocal bot_task
         if bot_task and not bot_task.done():
             logging.info("🛑 Stopping bot...")
             bot_task.cancel()
             try:
-                await bot_task
-            except asyncio.CancelledError:
+                # discord.py can hold on to the cancellation in the middle of a
+                # gateway operation; don't let that stall the reload. Without
+                # the shield, `wait_for` would cancel the task again on timeout
+                # and then wait for it, with no bound.
+                await asyncio.wait_for(asyncio.shield(bot_task), timeout=5.0)
+            except (asyncio.CancelledError, TimeoutError):
                 pass
-
-    def is_relevant_file(file_path: str) -> bool:
-        """Check if a file change should trigger a restart."""
-        path = Path(file_path)
-        return (
-            path.suffix == ".py"
-            and "__pycache__" not in path.parts
-            and not path.name.startswith(".")
-        ) or path.name == "config.toml"
+        # Cancelling `start` doesn't close the gateway connection, and Discord
+        # would keep the session around until it times out
+        if bot is not None and not bot.is_closed():
+            await bot.close()
 
     try:
         # Start the bot initially
@@ -259,20 +386,29 @@ async def run_bot_with_autoreload() -> None:
 
         # Watch for changes
         logging.info(
-            f"👀 Watching for changes in: {', '.join(str(p) for p in watch_paths)}"
+            "👀 Watching for changes in: %s", ", ".join(str(p) for p in _WATCH_PATHS)
         )
-        async for changes in awatch(*watch_paths, recursive=True):
-            relevant_changes = [
-                change for change in changes if is_relevant_file(change[1])
-            ]
-
-            if relevant_changes:
-                logging.info(
-                    f"📝 Detected changes: {[Path(change[1]).name for change in relevant_changes]}"
-                )
-                logging.info("🔄 Restarting process...")
-                # Restart the process
-                os.execv(sys.executable, [sys.executable] + sys.argv)
+        async for changes in awatch(
+            *_WATCH_PATHS, watch_filter=_ReloadFilter(), recursive=True
+        ):
+            changed_files = [change[1] for change in changes]
+            logging.info(
+                "📝 Detected changes: %s", [Path(f).name for f in changed_files]
+            )
+            if bot is not None:
+                try:
+                    if _reload_command_modules(bot, changed_files):
+                        logging.info("♻️ Reloaded commands")
+                        continue
+                except Exception:
+                    # Most likely a syntax error mid-edit; keep the old code running
+                    logging.exception("💥 Failed to reload commands")
+                    continue
+
+            logging.info("🔄 Restarting process...")
+            await stop_bot()
+            # Restart the process
+            os.execv(sys.executable, [sys.executable] + sys.argv)
 
     except KeyboardInterrupt:
         logging.info("🔄 Bot stopped by user")
@@ -300,20 +436,47 @@ async def main_async() -> None:
         sys.exit(1)
     dev_mode = os.environ.get("DEV_MODE", "false").lower() == "true"
 
+    _cancel_on_sigterm()
+
     if dev_mode:
         logging.info("🔧 Starting in development mode with autoreload...")
         await run_bot_with_autoreload()
     else:
         logging.info("🚀 Starting in production mode...")
         bot = await init_bot(dev_mode)
-        await bot.start(TOKEN)
+        # Closes the gateway connection on the way out, including on shutdown
+        async with bot:
+            await bot.start(TOKEN)
+
+
+def _cancel_on_sigterm() -> None:
+    """Shut down on SIGTERM the same way as on Ctrl-C.
+
+    `asyncio.run` already turns SIGINT into cancelling the main task, which
+    lets the bot close its connection. Deploys stop the bot with SIGTERM,
+    which would otherwise kill the process on the spot.
+    """
+    main_task = asyncio.current_task()
+    if main_task is None:
+        return
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, main_task.cancel)
+    except NotImplementedError:
+        # Signal handlers aren't supported on Windows
+        pass
 
 
 def main() -> None:
     """Run the bot."""
     try:
-        asyncio.run(main_async())
-    except KeyboardInterrupt:
-        print("Bot stopped by user")
+        if sys.platform == "win32":
+            asyncio.run(main_async())
+        else:
+            # uvloop is a faster drop-in event loop, but isn't available on Windows
+            import uvloop
+
+            uvloop.run(main_async())
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        print("Bot stopped")
     except Exception:
         logging.exception("An unexpected error occurred")
@@ -1,15 +1,40 @@
+import functools
 import re
+import sys
 from typing import Union
 
-from emilybot.parser.string_view import ArgumentParsingError, StringView
-from emilybot.execute.javascript_executor import extract_js_code
-from emilybot.parser.list_children_parser import (
-    is_list_children_pattern,
-    parse_list_children,
+from emilybot.parser.string_view import (
+    ArgumentParsingError,
+    ExpectedClosingQuoteError,
+    InvalidEndOfQuotedStringError,
+    StringView,
+    UnexpectedQuoteError,
+    _all_quotes,  # pyright: ignore[reportPrivateUsage]
+    _quotes,  # pyright: ignore[reportPrivateUsage]
 )
+from emilybot.execute.code_extraction import extract_js_code
+from emilybot.parser.list_children_parser import try_parse_list_children
 from emilybot.parser.types import JS, Command, ListChildren
 from emilybot.validation import validate_path, ValidationError
 
+# Decides whether a "$"-prefixed message is JavaScript, in a single match.
+# The `expr` group matches when the whole message is the code; otherwise the
+# code has to be extracted from it.
+_JS_RE = re.compile(
+    r"""\$(?:
+        (?P<expr>
+            [a-zA-Z]  # $foo("x")
+            | \d+[a-zA-Z_]  # $8ball(), $123abc(), $123_abc()
+        )
+        | \s+\S  # $ console.log()
+        | ```  # $```js...```
+    )""",
+    re.VERBOSE,
+)
+
+# A run of non-whitespace characters. `\s` matches what `str.isspace` does.
+_WORD_RE = re.compile(r"\S+")
+
 
 def parse_command_invocation(content: str) -> Command | None:
     """
@@ -23,54 +48,63 @@ def parse_command_invocation(content: str) -> Command | None:
 
     Examples:
         >>> parse_command_invocation("foo a b c")
-        Command(cmd='foo', args=['a', 'b', 'c'])
+        Command(cmd='foo', args=('a', 'b', 'c'))
 
         >>> parse_command_invocation("foo")
-        Command(cmd='foo', args=[])
+        Command(cmd='foo', args=())
 
         >>> parse_command_invocation("foo.bar a b c")
-        Command(cmd='foo/bar', args=['a', 'b', 'c'])
+        Command(cmd='foo/bar', args=('a', 'b', 'c'))
 
         >>> parse_command_invocation("foo/bar a b c")
-        Command(cmd='foo/bar', args=['a', 'b', 'c'])
+        Command(cmd='foo/bar', args=('a', 'b', 'c'))
 
         >>> parse_command_invocation("foo-bar a b c")
-        Command(cmd='foo-bar', args=['a', 'b', 'c'])
+        Command(cmd='foo-bar', args=('a', 'b', 'c'))
 
         >>> parse_command_invocation("") is None
         True
 
         >>> parse_command_invocation("$$") is None
         True
-    """
-
-    if not content:
-        return None
 
-    # Use StringView to parse the command and arguments
-    view = StringView(content)
+        >>> parse_command_invocation(" foo") is None
+        True
+    """
 
-    # Get the command name (first word)
-    cmd_name = view.get_word()
-    if not cmd_name:
+    # Get the command name (first word). It has to start right after the prefix.
+    word = _WORD_RE.match(content)
+    if word is None:
         return None
 
     try:
-        cmd_name = validate_path(
-            cmd_name,
-            allow_trailing_slash=False,
-            normalize_dots=True,
-            normalize_dashes=False,
-            check_component_length=True,
-        )
-        args = _parse_arguments(view)
-        return Command(cmd=cmd_name, args=args)
+        cmd_name = _normalize_command_name(word.group())
+        args = _parse_arguments(StringView(content[word.end() :]))
+        return Command(cmd=cmd_name, args=tuple(args))
     except (ValidationError, ArgumentParsingError):
         # Return None for invalid command names or malformed arguments
         # This allows the parser to try other patterns (JS, list children)
         return None
 
 
+@functools.lru_cache(maxsize=4096)
+def _normalize_command_name(name: str) -> str:
+    """
+    Validate a command name and normalize dots to slashes.
+
+    Command names repeat a lot, so results are cached and interned to share one
+    string object per name. Raises `ValidationError` for invalid names.
+    """
+    name = validate_path(
+        name,
+        allow_trailing_slash=False,
+        normalize_dots=True,
+        normalize_dashes=False,
+        check_component_length=True,
+    )
+    return sys.intern(name)
+
+
 def parse_message(
     message: str, extra_prefixes: list[str] = []
 ) -> Union[Command, JS, ListChildren, None]:
@@ -86,15 +120,18 @@ def parse_message(
         Either Command with cmd name and list of arguments, JS with code to execute,
         or ListChildren with parent command to list children of.
 
+        Results are cached, so the same object may be returned for repeated
+        messages. Callers must not mutate it.
+
     Command invocation:
         >>> parse_message("$foo a b c")
-        Command(cmd='foo', args=['a', 'b', 'c'])
+        Command(cmd='foo', args=('a', 'b', 'c'))
 
         >>> parse_message("$bar")
-        Command(cmd='bar', args=[])
+        Command(cmd='bar', args=())
 
         >>> parse_message(".foo a b c", extra_prefixes=["."])
-        Command(cmd='foo', args=['a', 'b', 'c'])
+        Command(cmd='foo', args=('a', 'b', 'c'))
 
     List children:
         >>> parse_message(".foo/x/", extra_prefixes=["."])
@@ -134,7 +171,7 @@ def parse_message(
 
     Normalization:
         >>> parse_message("$foo.bar a b c")
-        Command(cmd='foo/bar', args=['a', 'b', 'c'])
+        Command(cmd='foo/bar', args=('a', 'b', 'c'))
 
     Not a command:
         >>> parse_message("foo a b c") is None
@@ -170,19 +207,24 @@ def parse_message(
         >>> parse_message("$/foo/") is None  # Just slashes
         True
     """
+    all_prefixes = ("$", *extra_prefixes)
+    # Most messages are plain conversation; reject them before they reach (and
+    # evict entries from) the cache
+    if not message.startswith(all_prefixes):
+        return None
+    return _parse_message(message, all_prefixes)
 
-    # Determine the prefix used
-    all_prefixes = ["$"] + extra_prefixes
-    used_prefix = None
 
-    for prefix in all_prefixes:
-        if message.startswith(prefix):
-            used_prefix = prefix
-            break
+@functools.lru_cache(maxsize=1024)
+def _parse_message(
+    message: str, all_prefixes: tuple[str, ...]
+) -> Union[Command, JS, ListChildren, None]:
+    """Cached implementation of `parse_message`.
 
-    if used_prefix is None:
-        return None
+    The message must start with one of `all_prefixes`.
+    """
 
+    used_prefix = next(p for p in all_prefixes if message.startswith(p))
     content = message[len(used_prefix) :]
 
     if not content:
@@ -192,26 +234,20 @@ def parse_message(
         return command
 
     # Check for list children pattern first
-    if is_list_children_pattern(content):
-        return parse_list_children(content)
+    if list_children := try_parse_list_children(content):
+        return list_children
 
     # JavaScript parsing is only allowed for "$" prefix
-    if message.startswith("$"):
+    if used_prefix == "$":
         # The only valid JS patterns are:
         # 1. Letters: $foo("a", "b")
         # 2. Digits followed by underscore or letter: $8ball(), $123abc()
         # 3. Whitespace followed by anything: $ console.log()
         # 4. Code blocks: $```js...```
-        if (
-            re.match(r"^\$[a-zA-Z]", message)  # $foo("x")
-            or re.match(r"^\$\d+[a-zA-Z_]", message)  # $8ball(), $123abc(), $123_abc()
-        ):
-            return JS(code=message)
-        elif (
-            re.match(r"^\$\s+[^\s]", message)  # $ console.log()
-            or re.match(r"^\$```", message)  # $```js...```
-        ):
-            if code := extract_js_code(message[1:]):
+        if match := _JS_RE.match(message):
+            if match["expr"]:
+                return JS(code=message)
+            if code := extract_js_code(content):
                 return JS(code=code)
 
     return None
@@ -222,7 +258,8 @@ def _parse_arguments(view: StringView) -> list[str]:
     Parse command arguments using Discord.py's StringView class.
 
     This function uses StringView's get_quoted_word() method to properly handle
-    quoted strings and whitespace.
+    quoted strings and whitespace. Input without backslashes is tokenized by
+    `_split_arguments` instead, which gives the same result.
 
     Args:
         view: StringView instance positioned after the command name
@@ -239,6 +276,13 @@ def _parse_arguments(view: StringView) -> list[str]:
         >>> _parse_arguments(StringView('''a b "c d" 'e f g' '''))
         ['a', 'b', 'c d', "'e", 'f', "g'"]
     """
+    # Fast path: without escapes, we can find words and quotes with C-level
+    # string searches instead of going through the string char by char
+    rest = view.read_rest()
+    if "\\" not in rest:
+        return _split_arguments(rest)
+    view.undo()
+
     args: list[str] = []
 
     # Skip any leading whitespace
@@ -258,3 +302,45 @@ def _parse_arguments(view: StringView) -> list[str]:
         view.skip_ws()
 
     return args
+
+
+def _split_arguments(text: str) -> list[str]:
+    """
+    Split arguments the same way as `_parse_arguments`, for text without backslashes.
+
+    Examples:
+        >>> _split_arguments(' a  "b c" 「d」 ')
+        ['a', 'b c', 'd']
+        >>> _split_arguments('"unclosed')
+        Traceback (most recent call last):
+        ...
+        emilybot.parser.string_view.ExpectedClosingQuoteError: Expected closing ".
+    """
+    # Without quotes, arguments are just whitespace-separated words
+    if _all_quotes.isdisjoint(text):
+        return text.split()
+
+    args: list[str] = []
+    pos = 0
+    while match := _WORD_RE.search(text, pos):
+        start = match.start()
+        close_quote = _quotes.get(text[start])
+        if close_quote is None:
+            # Unquoted word. Quotes are only allowed as its first character
+            word = match.group()
+            if not _all_quotes.isdisjoint(word[1:]):
+                quote = next(c for c in word[1:] if c in _all_quotes)
+                raise UnexpectedQuoteError(quote)
+            args.append(word)
+            pos = match.end()
+        else:
+            # Quoted argument, which may contain whitespace and other quotes
+            end = text.find(close_quote, start + 1)
+            if end == -1:
+                raise ExpectedClosingQuoteError(close_quote)
+            after = text[end + 1 : end + 2]
+            if after and not after.isspace():
+                raise InvalidEndOfQuotedStringError(after)
+            args.append(text[start + 1 : end])
+            pos = end + 1
+    return args
@@ -1,3 +1,12 @@
+# Single characters that indicate JavaScript
+_JS_CHARS = frozenset(";+*<>!&|^%~")
+
+# Bracket pairs that indicate JavaScript (e.g. `foo()`, `xs[]`, `{}`)
+_JS_PAIRS = ("()", "[]", "{}")
+
+_QUOTE_CHARS = frozenset("'\"`")
+
+
 def is_js_pattern(content: str) -> bool:
     """
     Check if content looks like JavaScript code rather than a command.
@@ -7,38 +16,31 @@ def is_js_pattern(content: str) -> bool:
 
     Returns:
         True if content appears to be JavaScript code
-    """
-    # Check for JavaScript-like patterns
-    js_patterns = [
-        "()",
-        "[]",
-        "{}",
-        ";",
-        "+",
-        "*",
-        "<",
-        ">",
-        "!",
-        "&",
-        "|",
-        "^",
-        "%",
-        "~",
-    ]
-
-    # Check for specific JavaScript patterns
-    if any(char in content for char in js_patterns):
-        return True
 
-    # Check for regex patterns (starts with / and ends with /)
-    if content.startswith("/") and content.endswith("/") and len(content) > 2:
+    Examples:
+        >>> is_js_pattern("foo()")
+        True
+        >>> is_js_pattern("a + b")
+        True
+        >>> is_js_pattern("/regex/")
+        True
+        >>> is_js_pattern("// comment")
+        True
+        >>> is_js_pattern("/foo")
+        False
+        >>> is_js_pattern("foo bar")
+        False
+    """
+    # Check for comments (starts with //) and regex patterns (starts and ends with /)
+    if content.startswith("/") and (
+        content.startswith("//") or (content.endswith("/") and len(content) > 2)
+    ):
         return True
 
-    # Check for comments (starts with //)
-    if content.startswith("//"):
+    # Check for specific JavaScript patterns
+    if not _JS_CHARS.isdisjoint(content):
         return True
-
-    return False
+    return any(pair in content for pair in _JS_PAIRS)
 
 
 def is_quoted_content(content: str) -> bool:
@@ -50,5 +52,11 @@ def is_quoted_content(content: str) -> bool:
 
     Returns:
         True if content contains quotes
+
+    Examples:
+        >>> is_quoted_content("print('hi')")
+        True
+        >>> is_quoted_content("foo bar")
+        False
     """
-    return any(char in content for char in "'\"`")
+    return not _QUOTE_CHARS.isdisjoint(content)
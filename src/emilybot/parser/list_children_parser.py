@@ -1,38 +1,36 @@
 import re
+import sys
 
 from emilybot.parser.types import ListChildren
 
+# `$foo.`, `$foo/bar..`, `$foo/` (with optional trailing dots or slashes)
+_LIST_CHILDREN_RE = re.compile(r"([a-zA-Z0-9_][a-zA-Z0-9_/\-]*[a-zA-Z0-9_/])[./]+$")
 
-def parse_list_children(content: str) -> ListChildren:
-    """
-    Parse content as a request to list children of a command.
-
-    Args:
-        content: The content to parse (without the '$' prefix)
-
-    Returns:
-        ListChildren object with the parent command
-    """
-    # Handle dot notation patterns
-    # Check for $foo. (with optional trailing dots or slashes)
-    dot_listing_pattern = r"^([a-zA-Z0-9_][a-zA-Z0-9_/\-]*[a-zA-Z0-9_/])[./]+$"
-    dot_listing_match = re.match(dot_listing_pattern, content)
-    if dot_listing_match:
-        parent = dot_listing_match.group(1)
-        return ListChildren(parent=parent)
-
-    raise ValueError(f"Content '{content}' is not a valid list children pattern")
+# A list children pattern always ends with "." or "/". The `$` in the pattern
+# also allows a single newline after that.
+_LIST_CHILDREN_ENDINGS = (".", "/", ".\n", "/\n")
 
 
-def is_list_children_pattern(content: str) -> bool:
+def try_parse_list_children(content: str) -> ListChildren | None:
     """
-    Check if content looks like a list children pattern.
+    Parse content as a request to list children of a command, if it is one.
 
     Args:
-        content: The content to check (without the '$' prefix)
+        content: The content to parse (without the '$' prefix)
 
     Returns:
-        True if content appears to be a list children pattern
+        ListChildren object with the parent command, or None
+
+    Examples:
+        >>> try_parse_list_children("foo/bar..")
+        ListChildren(parent='foo/bar')
+        >>> try_parse_list_children("foo()") is None
+        True
     """
-    dot_listing_pattern = r"^([a-zA-Z0-9_][a-zA-Z0-9_/\-]*[a-zA-Z0-9_/])[./]+$"
-    return bool(re.match(dot_listing_pattern, content))
+    # Cheap check first: most content that gets here is JS like `foo()`
+    if not content.endswith(_LIST_CHILDREN_ENDINGS):
+        return None
+    dot_listing_match = _LIST_CHILDREN_RE.match(content)
+    if dot_listing_match is None:
+        return None
+    return ListChildren(parent=sys.intern(dot_listing_match.group(1)))
@@ -34,6 +34,7 @@ Original source: https://github.com/Rapptz/discord.py
 
 from __future__ import annotations
 
+import re
 from typing import Optional
 
 
@@ -125,8 +126,24 @@ _quotes = {
 }
 _all_quotes = set(_quotes.keys()) | set(_quotes.values())
 
+# Runs of whitespace and non-whitespace, for scanning words in one C-level call.
+# `\s` matches exactly what `str.isspace` does.
+_WS_RE = re.compile(r"\s*")
+_WORD_RE = re.compile(r"\S*")
+
+# Runs of characters that `get_quoted_word` copies as they are: anything but
+# a backslash and the closing quote inside quotes, and anything but a backslash,
+# a quote or whitespace outside of them
+_QUOTED_RUN_RES = {
+    close_quote: re.compile(f"[^\\\\{re.escape(close_quote)}]*")
+    for close_quote in _quotes.values()
+}
+_UNQUOTED_RUN_RE = re.compile(f"[^\\s\\\\{re.escape(''.join(_all_quotes))}]*")
+
 
 class StringView:
+    __slots__ = ("index", "buffer", "end", "previous")
+
     def __init__(self, buffer: str) -> None:
         self.index: int = 0
         self.buffer: str = buffer
@@ -145,19 +162,14 @@ class StringView:
         self.index = self.previous
 
     def skip_ws(self) -> bool:
-        pos = 0
-        while not self.eof:
-            try:
-                current = self.buffer[self.index + pos]
-                if not current.isspace():
-                    break
-                pos += 1
-            except IndexError:
-                break
+        start = self.index
+        # `match` would clamp a position past the end, so don't call it there
+        match = _WS_RE.match(self.buffer, start) if start < self.end else None
+        index = match.end() if match else start
 
-        self.previous = self.index
-        self.index += pos
-        return self.previous != self.index
+        self.previous = start
+        self.index = index
+        return start != index
 
     def skip_string(self, string: str) -> bool:
         strlen = len(string)
@@ -190,82 +202,98 @@ class StringView:
         return result
 
     def get_word(self) -> str:
-        pos = 0
-        while not self.eof:
-            try:
-                current = self.buffer[self.index + pos]
-                if current.isspace():
-                    break
-                pos += 1
-            except IndexError:
-                break
-        self.previous: int = self.index
-        result = self.buffer[self.index : self.index + pos]
-        self.index += pos
-        return result
+        start = self.index
+        match = _WORD_RE.match(self.buffer, start) if start < self.end else None
+        index = match.end() if match else start
+
+        self.previous = start
+        self.index = index
+        return self.buffer[start:index]
 
     def get_quoted_word(self) -> Optional[str]:
-        current = self.current
-        if current is None:
+        # Same as discord.py's version, but walks a local `index` instead of
+        # calling `self.get()` and the `eof` property for every character.
+        # `previous` and `index` are written back before every exit.
+        buffer, end = self.buffer, self.end
+        index, previous = self.index, self.previous
+        if index >= end:
             return None
+        current = buffer[index]
 
         close_quote = _quotes.get(current)
-        is_quoted = bool(close_quote)
-        if is_quoted:
+        if close_quote:
             result = []
             _escaped_quotes = (current, close_quote)
+            run_re = _QUOTED_RUN_RES[close_quote]
         else:
             result = [current]
             _escaped_quotes = _all_quotes
-
-        while not self.eof:
-            current = self.get()
-            if not current:
-                if is_quoted:
+            run_re = _UNQUOTED_RUN_RE
+
+        while index < end:
+            # Copy ordinary characters in one go, and stop on the last of them,
+            # so that the step below moves to the next special character
+            run = run_re.match(buffer, index + 1)
+            if run and run.end() > index + 1:
+                result.append(run.group())
+                index = run.end() - 1
+
+            previous, index = index, index + 1
+            if index >= end:
+                self.previous, self.index = previous, index
+                if close_quote:
                     # unexpected EOF
                     raise ExpectedClosingQuoteError(close_quote)
                 return "".join(result)
+            current = buffer[index]
 
             # currently we accept strings in the format of "hello world"
             # to embed a quote inside the string you must escape it: "a \"world\""
             if current == "\\":
-                next_char = self.get()
-                if not next_char:
+                previous, index = index, index + 1
+                if index >= end:
                     # string ends with \ and no character after it
-                    if is_quoted:
+                    self.previous, self.index = previous, index
+                    if close_quote:
                         # if we're quoted then we're expecting a closing quote
                         raise ExpectedClosingQuoteError(close_quote)
                     # if we aren't then we just let it through
                     return "".join(result)
 
+                next_char = buffer[index]
                 if next_char in _escaped_quotes:
                     # escaped quote
                     result.append(next_char)
                 else:
                     # different escape character, ignore it
-                    self.undo()
+                    index = previous
                     result.append(current)
                 continue
 
-            if not is_quoted and current in _all_quotes:
+            if not close_quote and current in _all_quotes:
                 # we aren't quoted
+                self.previous, self.index = previous, index
                 raise UnexpectedQuoteError(current)
 
             # closing quote
-            if is_quoted and current == close_quote:
-                next_char = self.get()
-                valid_eof = not next_char or next_char.isspace()
-                if not valid_eof:
-                    raise InvalidEndOfQuotedStringError(next_char)  # type: ignore # this will always be a string
+            if current == close_quote:
+                previous, index = index, index + 1
+                self.previous, self.index = previous, index
+                if index < end and not buffer[index].isspace():
+                    raise InvalidEndOfQuotedStringError(buffer[index])
 
                 # we're quoted so it's okay
                 return "".join(result)
 
-            if current.isspace() and not is_quoted:
+            if not close_quote and current.isspace():
                 # end of word found
+                self.previous, self.index = previous, index
                 return "".join(result)
 
             result.append(current)
 
+        self.previous, self.index = previous, index
+        return None
+
     def __repr__(self) -> str:
         return f"<StringView pos: {self.index} prev: {self.previous} end: {self.end} eof: {self.eof}>"
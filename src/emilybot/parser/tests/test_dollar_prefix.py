@@ -1,10 +1,36 @@
 """Test dollar prefix functionality"""
 
+import logging
+
 import pytest
+from emilybot.execute.javascript_executor import (
+    CommandData,
+    Context,
+    CtxMessage,
+    CtxServer,
+    JavaScriptExecutor,
+    create_test_user,
+)
 from emilybot.execute.run_code import run_code
 from emilybot.conftest import MakeCtx
 from emilybot.test_utils import ReplyConfig
 
+# Shared by the executor tests below; execute() only serializes them.
+_CONTEXT = Context(
+    message=CtxMessage(text="test message content"),
+    reply_to=None,
+    user=create_test_user(
+        id="12345",
+        handle="TestUser",
+        name="TestUser",
+        global_name="TestUser",
+        avatar_url="https://cdn.discordapp.com/avatars/12345/1234567890.png",
+    ),
+    server=CtxServer(id="67890"),
+)
+
+_WEATHER = CommandData(name="weather", content="Sunny, 75°F", run=None)
+
 
 @pytest.mark.asyncio
 async def test_dollar_prefix_javascript_execution(make_ctx: MakeCtx):
@@ -21,42 +47,12 @@ async def test_dollar_prefix_javascript_execution(make_ctx: MakeCtx):
 
 
 @pytest.mark.asyncio
-async def test_dollar_prefix_global_commands():
+async def test_dollar_prefix_global_commands(js_executor: JavaScriptExecutor):
     """Test that commands become available as global variables"""
 
-    # Create executor
-    from emilybot.execute.javascript_executor import (
-        JavaScriptExecutor,
-        CommandData,
-        Context,
-        CtxMessage,
-        create_test_user,
-        CtxServer,
-    )
-
-    executor = JavaScriptExecutor()
-
-    # Create context
-    context = Context(
-        message=CtxMessage(text="test message content"),
-        reply_to=None,
-        user=create_test_user(
-            id="12345",
-            handle="TestUser",
-            name="TestUser",
-            global_name="TestUser",
-            avatar_url="https://cdn.discordapp.com/avatars/12345/1234567890.png",
-        ),
-        server=CtxServer(id="67890"),
-    )
-
     # Create test commands
     commands = [
-        CommandData(
-            name="weather",
-            content="Sunny, 75°F",
-            run=None,
-        ),
+        _WEATHER,
         CommandData(
             name="user-settings",
             content="theme: dark",
@@ -75,7 +71,7 @@ async def test_dollar_prefix_global_commands():
     ]
 
     # Test global command objects
-    success, output, _value = await executor.execute(
+    success, output, _value = await js_executor.execute(
         """
         console.log("Testing global command objects");
         console.log("$weather._name:", $weather._name);
@@ -87,58 +83,32 @@ async def test_dollar_prefix_global_commands():
         console.log("$docs.install._name:", $docs.install._name);
         console.log("$docs.install._content:", $docs.install._content);
     """,
-        context,
+        _CONTEXT,
         commands,
     )
 
     assert success
-    assert "$weather._name: weather" in output
-    assert "$weather._content: Sunny, 75°F" in output
-    assert "$user_settings._name: user-settings" in output
-    assert "$user_settings._content: theme: dark" in output
-    assert "$docs.api._name: docs/api" in output
-    assert "$docs.api._content: API documentation" in output
-    assert "$docs.install._name: docs/install" in output
-    assert "$docs.install._content: Installation guide" in output
+    expected = {
+        "$weather._name: weather",
+        "$weather._content: Sunny, 75°F",
+        "$user_settings._name: user-settings",
+        "$user_settings._content: theme: dark",
+        "$docs.api._name: docs/api",
+        "$docs.api._content: API documentation",
+        "$docs.install._name: docs/install",
+        "$docs.install._content: Installation guide",
+    }
+    output_lines = set(output.splitlines())
+    assert expected <= output_lines, expected - output_lines
 
 
 @pytest.mark.asyncio
-async def test_dollar_prefix_command_execution():
+async def test_dollar_prefix_command_execution(js_executor: JavaScriptExecutor):
     """Test that global command objects are callable"""
 
-    # Create executor
-    from emilybot.execute.javascript_executor import (
-        JavaScriptExecutor,
-        CommandData,
-        Context,
-        CtxMessage,
-        create_test_user,
-        CtxServer,
-    )
-
-    executor = JavaScriptExecutor()
-
-    # Create context
-    context = Context(
-        message=CtxMessage(text="test message content"),
-        reply_to=None,
-        user=create_test_user(
-            id="12345",
-            handle="TestUser",
-            name="TestUser",
-            global_name="TestUser",
-            avatar_url="https://cdn.discordapp.com/avatars/12345/1234567890.png",
-        ),
-        server=CtxServer(id="67890"),
-    )
-
     # Create test commands
     commands = [
-        CommandData(
-            name="weather",
-            content="Sunny, 75°F",
-            run=None,
-        ),
+        _WEATHER,
         CommandData(
             name="greeting",
             content="Hello, world!",
@@ -147,7 +117,7 @@ async def test_dollar_prefix_command_execution():
     ]
 
     # Test calling commands
-    success, output, value = await executor.execute(
+    success, output, value = await js_executor.execute(
         """
         console.log("Calling weather command:");
         $weather();
@@ -156,13 +126,11 @@ async def test_dollar_prefix_command_execution():
         console.log("Testing $greeting._run():");
         $greeting._run();
     """,
-        context,
+        _CONTEXT,
         commands,
     )
 
-    print(f"Success: {success}")
-    print(f"Output: {output}")
-    print(f"Value: {value}")
+    logging.debug("success=%s output=%s value=%s", success, output, value)
     assert success
     assert "Sunny, 75°F" in output
     # The greeting command should show its content when called directly
@@ -170,35 +138,9 @@ async def test_dollar_prefix_command_execution():
 
 
 @pytest.mark.asyncio
-async def test_dollar_prefix_nested_commands():
+async def test_dollar_prefix_nested_commands(js_executor: JavaScriptExecutor):
     """Test that nested commands work correctly"""
 
-    # Create executor
-    from emilybot.execute.javascript_executor import (
-        JavaScriptExecutor,
-        CommandData,
-        Context,
-        CtxMessage,
-        create_test_user,
-        CtxServer,
-    )
-
-    executor = JavaScriptExecutor()
-
-    # Create context
-    context = Context(
-        message=CtxMessage(text="test message content"),
-        reply_to=None,
-        user=create_test_user(
-            id="12345",
-            handle="TestUser",
-            name="TestUser",
-            global_name="TestUser",
-            avatar_url="https://cdn.discordapp.com/avatars/12345/1234567890.png",
-        ),
-        server=CtxServer(id="67890"),
-    )
-
     # Create test commands
     commands = [
         CommandData(
@@ -219,7 +161,7 @@ async def test_dollar_prefix_nested_commands():
     ]
 
     # Test nested command access
-    success, output, _value = await executor.execute(
+    success, output, _value = await js_executor.execute(
         """
         console.log("Testing nested commands:");
         console.log("$api.v1.users._name:", $api.v1.users._name);
@@ -229,60 +171,34 @@ async def test_dollar_prefix_nested_commands():
         console.log("$docs.getting_started._name:", $docs.getting_started._name);
         console.log("$docs.getting_started._content:", $docs.getting_started._content);
     """,
-        context,
+        _CONTEXT,
         commands,
     )
 
     assert success
-    assert "$api.v1.users._name: api/v1/users" in output
-    assert "$api.v1.users._content: User endpoints" in output
-    assert "$api.v1.orders._name: api/v1/orders" in output
-    assert "$api.v1.orders._content: Order endpoints" in output
-    assert "$docs.getting_started._name: docs/getting-started" in output
-    assert "$docs.getting_started._content: Getting started guide" in output
+    expected = {
+        "$api.v1.users._name: api/v1/users",
+        "$api.v1.users._content: User endpoints",
+        "$api.v1.orders._name: api/v1/orders",
+        "$api.v1.orders._content: Order endpoints",
+        "$docs.getting_started._name: docs/getting-started",
+        "$docs.getting_started._content: Getting started guide",
+    }
+    output_lines = set(output.splitlines())
+    assert expected <= output_lines, expected - output_lines
 
 
 @pytest.mark.asyncio
-async def test_dollar_prefix_legacy_compatibility():
+async def test_dollar_prefix_legacy_compatibility(js_executor: JavaScriptExecutor):
     """Test that legacy $.commands access still works"""
 
-    # Create executor
-    from emilybot.execute.javascript_executor import (
-        JavaScriptExecutor,
-        CommandData,
-        Context,
-        CtxMessage,
-        create_test_user,
-        CtxServer,
-    )
-
-    executor = JavaScriptExecutor()
-
-    # Create context
-    context = Context(
-        message=CtxMessage(text="test message content"),
-        reply_to=None,
-        user=create_test_user(
-            id="12345",
-            handle="TestUser",
-            name="TestUser",
-            global_name="TestUser",
-            avatar_url="https://cdn.discordapp.com/avatars/12345/1234567890.png",
-        ),
-        server=CtxServer(id="67890"),
-    )
-
     # Create test commands
     commands = [
-        CommandData(
-            name="weather",
-            content="Sunny, 75°F",
-            run=None,
-        ),
+        _WEATHER,
     ]
 
     # Test legacy access
-    success, output, _value = await executor.execute(
+    success, output, _value = await js_executor.execute(
         """
         console.log("Testing legacy access:");
         console.log("$.commands.weather.name:", $.commands.weather.name);
@@ -290,7 +206,7 @@ async def test_dollar_prefix_legacy_compatibility():
         console.log("$.cmd('weather'):");
         $.cmd('weather');
     """,
-        context,
+        _CONTEXT,
         commands,
     )
 
@@ -301,35 +217,9 @@ async def test_dollar_prefix_legacy_compatibility():
 
 
 @pytest.mark.asyncio
-async def test_dollar_prefix_command_arguments():
+async def test_dollar_prefix_command_arguments(js_executor: JavaScriptExecutor):
     """Test that commands can accept arguments when called with $ prefix"""
 
-    # Create executor
-    from emilybot.execute.javascript_executor import (
-        JavaScriptExecutor,
-        CommandData,
-        Context,
-        CtxMessage,
-        create_test_user,
-        CtxServer,
-    )
-
-    executor = JavaScriptExecutor()
-
-    # Create context
-    context = Context(
-        message=CtxMessage(text="test message content"),
-        reply_to=None,
-        user=create_test_user(
-            id="12345",
-            handle="TestUser",
-            name="TestUser",
-            global_name="TestUser",
-            avatar_url="https://cdn.discordapp.com/avatars/12345/1234567890.png",
-        ),
-        server=CtxServer(id="67890"),
-    )
-
     # Create test commands with argument handling
     commands = [
         CommandData(
@@ -350,7 +240,7 @@ async def test_dollar_prefix_command_arguments():
     ]
 
     # Test calling commands with arguments
-    success, output, value = await executor.execute(
+    success, output, value = await js_executor.execute(
         """
         console.log("Testing command arguments:");
         $greeting("Alice", "Bob");
@@ -358,13 +248,11 @@ async def test_dollar_prefix_command_arguments():
         $welcome("Charlie");
         $welcome();
     """,
-        context,
+        _CONTEXT,
         commands,
     )
 
-    print(f"Success: {success}")
-    print(f"Output: {output}")
-    print(f"Value: {value}")
+    logging.debug("success=%s output=%s value=%s", success, output, value)
     assert success
     assert "Hello Alice and Bob!" in output
     assert 'Args: [ "Hello", "World", "Test" ]' in output
@@ -374,35 +262,9 @@ async def test_dollar_prefix_command_arguments():
 
 
 @pytest.mark.asyncio
-async def test_dollar_prefix_arguments_via_cmd():
+async def test_dollar_prefix_arguments_via_cmd(js_executor: JavaScriptExecutor):
     """Test that $.cmd() function can pass arguments to commands"""
 
-    # Create executor
-    from emilybot.execute.javascript_executor import (
-        JavaScriptExecutor,
-        CommandData,
-        Context,
-        CtxMessage,
-        create_test_user,
-        CtxServer,
-    )
-
-    executor = JavaScriptExecutor()
-
-    # Create context
-    context = Context(
-        message=CtxMessage(text="test message content"),
-        reply_to=None,
-        user=create_test_user(
-            id="12345",
-            handle="TestUser",
-            name="TestUser",
-            global_name="TestUser",
-            avatar_url="https://cdn.discordapp.com/avatars/12345/1234567890.png",
-        ),
-        server=CtxServer(id="67890"),
-    )
-
     # Create test command
     commands = [
         CommandData(
@@ -413,18 +275,16 @@ async def test_dollar_prefix_arguments_via_cmd():
     ]
 
     # Test calling command with arguments via $.cmd()
-    success, output, value = await executor.execute(
+    success, output, value = await js_executor.execute(
         """
         console.log("Testing $.cmd() with arguments:");
         $.cmd("test-args", "first", "second", "third");
     """,
-        context,
+        _CONTEXT,
         commands,
     )
 
-    print(f"Success: {success}")
-    print(f"Output: {output}")
-    print(f"Value: {value}")
+    logging.debug("success=%s output=%s value=%s", success, output, value)
     assert success
     assert 'Received args: [ "first", "second", "third" ]' in output
     assert "First arg: first" in output
@@ -449,9 +309,7 @@ async def test_message_reply_access(make_ctx: MakeCtx):
         code="console.log('Reply text:', reply_to.text); console.log('Reply author:', reply_to.user)",
     )
 
-    print(f"Success: {success}")
-    print(f"Output: {output}")
-    print(f"Value: {_value}")
+    logging.debug("success=%s output=%s value=%s", success, output, _value)
     assert success
     assert "Reply text: This is the original message being replied to" in output
     assert "OriginalAuthor" in output
@@ -1,39 +1,53 @@
 #!/usr/bin/env python3
 """Integration tests for dollar whitespace handling in main handler."""
 
+import pytest
+
+from emilybot.execute.javascript_executor import (
+    JavaScriptExecutor,
+    CommandData,
+    Context,
+    CtxMessage,
+    create_test_user,
+    CtxServer,
+)
+from emilybot.parser import parse_message, Command, JS
+
+
+# Messages where `$` is followed by whitespace, i.e. the `$ code` form
+DOLLAR_WHITESPACE_MESSAGES = [
+    "$ foo",
+    "$\nfoo",
+    "$\tfoo",
+    "$   foo",
+    "$ \t\n foo",
+]
+
+
+def should_handle_dollar_command(message_content: str) -> bool:
+    """Simulate the logic from main.py for detecting dollar commands."""
+    return (
+        message_content.startswith("$")
+        and len(message_content) > 1
+        and message_content[1].isspace()
+    )
+
 
-def test_main_handler_whitespace_detection():
+@pytest.mark.parametrize("message", DOLLAR_WHITESPACE_MESSAGES)
+def test_main_handler_whitespace_detection(message: str):
     """Test that the main handler correctly detects dollar followed by any whitespace."""
+    assert should_handle_dollar_command(message)
+
+
+@pytest.mark.parametrize("message", ["$foo", "$", "foo", "$123", "$!foo"])
+def test_main_handler_no_whitespace(message: str):
+    """Test that the main handler ignores messages without whitespace after dollar."""
+    assert not should_handle_dollar_command(message)
 
-    def should_handle_dollar_command(message_content: str) -> bool:
-        """Simulate the logic from main.py for detecting dollar commands."""
-        return (
-            message_content.startswith("$")
-            and len(message_content) > 1
-            and message_content[1].isspace()
-        )
-
-    # Test cases that should be handled
-    assert should_handle_dollar_command("$ foo")
-    assert should_handle_dollar_command("$\nfoo")
-    assert should_handle_dollar_command("$\tfoo")
-    assert should_handle_dollar_command("$   foo")
-    assert should_handle_dollar_command("$ \t\n foo")
-
-    # Test cases that should NOT be handled (no whitespace after $)
-    assert not should_handle_dollar_command("$foo")
-    assert not should_handle_dollar_command("$")
-    assert not should_handle_dollar_command("foo")
-    assert not should_handle_dollar_command("$123")
-    assert not should_handle_dollar_command("$!foo")
-
-
-def test_parser_whitespace_handling():
-    """Test that the parser correctly handles all whitespace types."""
-    from emilybot.parser import parse_message, JS
 
-    # Test various whitespace patterns
-    test_cases = [
+@pytest.mark.parametrize(
+    "input_str,expected_code",
+    [
         ("$ foo", "foo"),
         ("$\nfoo", "foo"),
         ("$\tfoo", "foo"),
@@ -42,109 +56,75 @@ def test_parser_whitespace_handling():
         ("$ 2 + 2", "2 + 2"),
         ("$\nconsole.log('hello')", "console.log('hello')"),
         ("$\tMath.random()", "Math.random()"),
-    ]
-
-    for input_str, expected_code in test_cases:
-        result = parse_message(input_str)
-        assert isinstance(result, JS), f"Expected JS for '{input_str}'"
-        assert result.code == expected_code, (
-            f"Expected '{expected_code}' for '{input_str}', got '{result.code}'"
-        )
+    ],
+)
+def test_parser_whitespace_handling(input_str: str, expected_code: str):
+    """Test that the parser correctly handles all whitespace types."""
+    result = parse_message(input_str)
+    assert isinstance(result, JS), f"Expected JS for '{input_str}'"
+    assert result.code == expected_code, (
+        f"Expected '{expected_code}' for '{input_str}', got '{result.code}'"
+    )
 
 
-def test_whitespace_consistency():
+@pytest.mark.parametrize("pattern", DOLLAR_WHITESPACE_MESSAGES)
+def test_whitespace_consistency(pattern: str):
     """Test that main handler and parser are consistent in whitespace handling."""
-    from emilybot.parser import parse_message, JS
-
-    def should_handle_dollar_command(message_content: str) -> bool:
-        """Simulate the logic from main.py for detecting dollar commands."""
-        return (
-            message_content.startswith("$")
-            and len(message_content) > 1
-            and message_content[1].isspace()
-        )
-
-    # Test that all patterns detected by main handler are also handled by parser
-    test_patterns = [
-        "$ foo",
-        "$\nfoo",
-        "$\tfoo",
-        "$   foo",
-        "$ \t\n foo",
-    ]
-
-    for pattern in test_patterns:
-        # Main handler should detect this
-        assert should_handle_dollar_command(pattern), (
-            f"Main handler should detect: {pattern}"
-        )
+    # Main handler should detect this
+    assert should_handle_dollar_command(pattern), (
+        f"Main handler should detect: {pattern}"
+    )
 
-        # Parser should handle this as JS
-        result = parse_message(pattern)
-        assert isinstance(result, JS), f"Parser should return JS for: {pattern}"
+    # Parser should handle this as JS
+    result = parse_message(pattern)
+    assert isinstance(result, JS), f"Parser should return JS for: {pattern}"
 
 
-def test_argument_handling_integration():
+@pytest.mark.asyncio
+async def test_argument_handling_integration(js_executor: JavaScriptExecutor):
     """Test that argument handling works end-to-end from parsing to execution."""
-    from emilybot.parser import parse_message, Command
-    from emilybot.execute.javascript_executor import (
-        JavaScriptExecutor,
-        CommandData,
-        Context,
-        CtxMessage,
-        create_test_user,
-        CtxServer,
-    )
-    import asyncio
 
     # Test parsing
     result = parse_message("$greeting Alice Bob")
     assert isinstance(result, Command)
     assert result.cmd == "greeting"
-    assert result.args == ["Alice", "Bob"]
+    assert result.args == ("Alice", "Bob")
 
     # Test execution
-    async def test_execution():
-        executor = JavaScriptExecutor()
-        context = Context(
-            message=CtxMessage(text="$greeting Alice Bob"),
-            reply_to=None,
-            user=create_test_user(
-                id="12345",
-                handle="TestUser",
-                name="TestUser",
-                global_name="TestUser",
-                avatar_url="https://cdn.discordapp.com/avatars/12345/1234567890.png",
-            ),
-            server=CtxServer(id="67890"),
-        )
-        commands = [
-            CommandData(
-                name="greeting",
-                content="Hello, world!",
-                run="console.log('Hello ' + args[0] + ' and ' + args[1] + '!')",
-            ),
-        ]
-
-        success, output, _value = await executor.execute(
-            "$greeting('Alice', 'Bob')",
-            context,
-            commands,
-        )
-
-        assert success
-        assert "Hello Alice and Bob!" in output
-
-    # Run the async test
-    asyncio.run(test_execution())
+    context = Context(
+        message=CtxMessage(text="$greeting Alice Bob"),
+        reply_to=None,
+        user=create_test_user(
+            id="12345",
+            handle="TestUser",
+            name="TestUser",
+            global_name="TestUser",
+            avatar_url="https://cdn.discordapp.com/avatars/12345/1234567890.png",
+        ),
+        server=CtxServer(id="67890"),
+    )
+    commands = [
+        CommandData(
+            name="greeting",
+            content="Hello, world!",
+            run="console.log('Hello ' + args[0] + ' and ' + args[1] + '!')",
+        ),
+    ]
+
+    success, output, _value = await js_executor.execute(
+        "$greeting('Alice', 'Bob')",
+        context,
+        commands,
+    )
+
+    assert success
+    assert "Hello Alice and Bob!" in output
 
 
 def test_argument_handling_with_special_characters():
     """Test that argument handling works with special characters."""
-    from emilybot.parser import parse_message, Command
-
     # Test parsing with special characters
     result = parse_message('$echo hello-world test_arg "quoted string"')
     assert isinstance(result, Command)
     assert result.cmd == "echo"
-    assert result.args == ["hello-world", "test_arg", "quoted string"]
+    assert result.args == ("hello-world", "test_arg", "quoted string")
@@ -1,6 +1,11 @@
 """Unit tests for command parser functionality."""
 
+import dataclasses
+
+import pytest
+
 from emilybot.parser import parse_message, Command, JS, ListChildren
+from emilybot.parser.command_parser import _parse_message  # pyright: ignore[reportPrivateUsage]
 
 
 class TestParser:
@@ -11,42 +16,42 @@ class TestParser:
         result = parse_message("$foo a b c")
         assert isinstance(result, Command)
         assert result.cmd == "foo"
-        assert result.args == ["a", "b", "c"]
+        assert result.args == ("a", "b", "c")
 
     def test_command_without_args(self):
         """Test that command without arguments is parsed correctly."""
         result = parse_message("$bar")
         assert isinstance(result, Command)
         assert result.cmd == "bar"
-        assert result.args == []
+        assert result.args == ()
 
     def test_command_with_single_arg(self):
         """Test that command with single argument is parsed correctly."""
         result = parse_message("$test hello")
         assert isinstance(result, Command)
         assert result.cmd == "test"
-        assert result.args == ["hello"]
+        assert result.args == ("hello",)
 
     def test_command_with_underscores(self):
         """Test that command with underscores is parsed correctly."""
         result = parse_message("$user_settings dark")
         assert isinstance(result, Command)
         assert result.cmd == "user_settings"
-        assert result.args == ["dark"]
+        assert result.args == ("dark",)
 
     def test_command_with_slashes(self):
         """Test that command with slashes is parsed correctly."""
         result = parse_message("$docs/api reference")
         assert isinstance(result, Command)
         assert result.cmd == "docs/api"
-        assert result.args == ["reference"]
+        assert result.args == ("reference",)
 
     def test_command_with_numbers(self):
         """Test that command with numbers is parsed correctly."""
         result = parse_message("$api_v1 users")
         assert isinstance(result, Command)
         assert result.cmd == "api_v1"
-        assert result.args == ["users"]
+        assert result.args == ("users",)
 
     def test_javascript_with_semicolon(self):
         """Test that JavaScript with semicolon is treated as JS."""
@@ -77,7 +82,7 @@ class TestParser:
         result = parse_message("$object.property")
         assert isinstance(result, Command)
         assert result.cmd == "object/property"
-        assert result.args == []
+        assert result.args == ()
 
     def test_javascript_with_function_call(self):
         """Test that JavaScript function calls are treated as JS."""
@@ -90,7 +95,7 @@ class TestParser:
         result = parse_message("$let x = 5")
         assert isinstance(result, Command)
         assert result.cmd == "let"
-        assert result.args == ["x", "=", "5"]
+        assert result.args == ("x", "=", "5")
 
     def test_javascript_with_multiline(self):
         """Test that JavaScript with newlines is treated as JS."""
@@ -103,49 +108,49 @@ class TestParser:
         result = parse_message("$foo  a   b    c")
         assert isinstance(result, Command)
         assert result.cmd == "foo"
-        assert result.args == ["a", "b", "c"]
+        assert result.args == ("a", "b", "c")
 
     def test_command_with_tabs(self):
         """Test that command with tabs is parsed correctly."""
         result = parse_message("$foo\ta\tb\tc")
         assert isinstance(result, Command)
         assert result.cmd == "foo"
-        assert result.args == ["a", "b", "c"]
+        assert result.args == ("a", "b", "c")
 
     def test_command_with_mixed_whitespace(self):
         """Test that command with mixed whitespace is parsed correctly."""
         result = parse_message("$foo a\tb  c")
         assert isinstance(result, Command)
         assert result.cmd == "foo"
-        assert result.args == ["a", "b", "c"]
+        assert result.args == ("a", "b", "c")
 
     def test_command_with_quoted_arguments(self):
         """Test that command with quoted arguments is parsed correctly."""
         result = parse_message('$foo "hello world" "test arg"')
         assert isinstance(result, Command)
         assert result.cmd == "foo"
-        assert result.args == ["hello world", "test arg"]
+        assert result.args == ("hello world", "test arg")
 
     def test_command_with_special_characters_in_args(self):
         """Test that command with special characters in arguments is parsed correctly."""
         result = parse_message("$foo arg1 arg2-with-dashes arg3_with_underscores")
         assert isinstance(result, Command)
         assert result.cmd == "foo"
-        assert result.args == ["arg1", "arg2-with-dashes", "arg3_with_underscores"]
+        assert result.args == ("arg1", "arg2-with-dashes", "arg3_with_underscores")
 
     def test_command_with_no_arguments(self):
         """Test that command with no arguments is parsed correctly."""
         result = parse_message("$foo")
         assert isinstance(result, Command)
         assert result.cmd == "foo"
-        assert result.args == []
+        assert result.args == ()
 
     def test_command_with_empty_args(self):
         """Test that command with empty args is parsed correctly."""
         result = parse_message("$foo a  b   c")
         assert isinstance(result, Command)
         assert result.cmd == "foo"
-        assert result.args == ["a", "b", "c"]
+        assert result.args == ("a", "b", "c")
 
     def test_invalid_no_dollar_prefix(self):
         """Test that message without $ prefix returns None."""
@@ -216,42 +221,42 @@ class TestParser:
         result = parse_message("$foo.bar")
         assert isinstance(result, Command)
         assert result.cmd == "foo/bar"
-        assert result.args == []
+        assert result.args == ()
 
     def test_dot_command_with_args(self):
         """Test that $foo.bar a b c is treated as command foo/bar with args."""
         result = parse_message("$foo.bar a b c")
         assert isinstance(result, Command)
         assert result.cmd == "foo/bar"
-        assert result.args == ["a", "b", "c"]
+        assert result.args == ("a", "b", "c")
 
     def test_dot_command_with_underscores(self):
         """Test that $foo.bar_baz is treated as command foo/bar_baz."""
         result = parse_message("$foo.bar_baz")
         assert isinstance(result, Command)
         assert result.cmd == "foo/bar_baz"
-        assert result.args == []
+        assert result.args == ()
 
     def test_dot_command_with_hyphens(self):
         """Test that $foo.bar-baz is treated as command foo/bar-baz."""
         result = parse_message("$foo.bar-baz")
         assert isinstance(result, Command)
         assert result.cmd == "foo/bar-baz"
-        assert result.args == []
+        assert result.args == ()
 
     def test_dot_command_with_slashes(self):
         """Test that $foo.bar/baz is treated as command foo/bar/baz."""
         result = parse_message("$foo.bar/baz")
         assert isinstance(result, Command)
         assert result.cmd == "foo/bar/baz"
-        assert result.args == []
+        assert result.args == ()
 
     def test_dot_command_with_numbers(self):
         """Test that $foo.bar123 is treated as command foo/bar123."""
         result = parse_message("$foo.bar123")
         assert isinstance(result, Command)
         assert result.cmd == "foo/bar123"
-        assert result.args == []
+        assert result.args == ()
 
     def test_underscore_start_child_is_js(self):
         """Test that $foo._bar is treated as JavaScript (child starts with _)."""
@@ -301,10 +306,9 @@ class TestParser:
         assert isinstance(result, ListChildren)
         assert result.parent == "foo/bar"
 
-    def test_common_js_patterns_as_commands(self):
-        """Test that common JavaScript patterns are now treated as commands."""
-        # These should now be treated as commands with dot notation applied
-        command_patterns = [
+    @pytest.mark.parametrize(
+        "pattern,expected_cmd",
+        [
             ("$console.log", "console/log"),
             ("$document.getElementById", "document/getElementById"),
             ("$window.location", "window/location"),
@@ -313,9 +317,41 @@ class TestParser:
             ("$Promise.resolve", "Promise/resolve"),
             ("$fetch", "fetch"),
             ("$JSON.stringify", "JSON/stringify"),
-        ]
-
-        for pattern, expected_cmd in command_patterns:
-            result = parse_message(pattern)
-            assert isinstance(result, Command), f"Expected Command for: {pattern}"
-            assert result.cmd == expected_cmd
+        ],
+    )
+    def test_common_js_patterns_as_commands(self, pattern: str, expected_cmd: str):
+        """Test that common JavaScript patterns are now treated as commands."""
+        # These should now be treated as commands with dot notation applied
+        result = parse_message(pattern)
+        assert isinstance(result, Command), f"Expected Command for: {pattern}"
+        assert result.cmd == expected_cmd
+
+    def test_repeated_message_with_different_prefixes(self):
+        """Test that cached results are not shared between prefix configurations."""
+        assert parse_message(".foo") is None
+        result = parse_message(".foo", extra_prefixes=["."])
+        assert isinstance(result, Command)
+        assert result.cmd == "foo"
+        assert parse_message(".foo") is None
+
+    def test_unprefixed_messages_skip_the_cache(self):
+        """Test that plain conversation is rejected before the result cache."""
+        before = _parse_message.cache_info()
+        assert parse_message("just chatting, nothing to see here") is None
+        assert parse_message("") is None
+        after = _parse_message.cache_info()
+        assert (after.hits, after.misses) == (before.hits, before.misses)
+
+    def test_parsed_results_are_immutable(self):
+        """Test that results, which are cached and shared, can't be modified."""
+        result = parse_message("$foo a")
+        assert isinstance(result, Command)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.cmd = "bar"  # type: ignore[misc]
+        assert not hasattr(result, "__dict__")
+        assert hash(result) == hash(Command(cmd="foo", args=("a",)))
+
+    def test_repeated_message_is_cached(self):
+        """Test that parsing the same message twice reuses the cached result."""
+        first = parse_message("$cached a b", extra_prefixes=["."])
+        assert parse_message("$cached a b", extra_prefixes=["."]) is first
@@ -21,7 +21,7 @@ from emilybot.parser.string_view import (
 
 
 # Test data: various inputs that exercise different code paths
-TEST_INPUTS = [
+TEST_INPUTS = (
     # Simple words
     "hello",
     "hello world",
@@ -73,28 +73,28 @@ TEST_INPUTS = [
     # Complex cases
     'cmd "arg 1" arg2 "arg 3"',
     '"first arg" second "third arg" fourth',
-]
+)
 
 
-class TestGetWord:
-    """Test get_word() method equivalence."""
+class TestSimpleOperations:
+    """Test equivalence of the methods that never raise."""
 
+    @pytest.mark.parametrize("op", ["get_word", "skip_ws", "read_rest"])
     @pytest.mark.parametrize("input_str", TEST_INPUTS)
-    def test_get_word_equivalence(self, input_str: str) -> None:
-        """Test that get_word() produces identical results."""
+    def test_equivalence(self, input_str: str, op: str) -> None:
+        """Test that the method returns the same value and leaves the same state."""
         discord_view = DiscordStringView(input_str)
         our_view = OurStringView(input_str)
 
-        # Get first word from both
-        discord_word = discord_view.get_word()
-        our_word = our_view.get_word()
+        discord_result = getattr(discord_view, op)()
+        our_result = getattr(our_view, op)()
 
-        assert our_word == discord_word, f"get_word() mismatch for input: {input_str!r}"
+        assert our_result == discord_result, f"{op}() mismatch for input: {input_str!r}"
         assert our_view.index == discord_view.index, (
-            f"index mismatch after get_word() for input: {input_str!r}"
+            f"index mismatch after {op}() for input: {input_str!r}"
         )
         assert our_view.eof == discord_view.eof, (
-            f"eof mismatch after get_word() for input: {input_str!r}"
+            f"eof mismatch after {op}() for input: {input_str!r}"
         )
 
 
@@ -162,52 +162,6 @@ class TestGetQuotedWord:
             )
 
 
-class TestSkipWs:
-    """Test skip_ws() method equivalence."""
-
-    @pytest.mark.parametrize("input_str", TEST_INPUTS)
-    def test_skip_ws_equivalence(self, input_str: str) -> None:
-        """Test that skip_ws() produces identical results."""
-        discord_view = DiscordStringView(input_str)
-        our_view = OurStringView(input_str)
-
-        discord_result = discord_view.skip_ws()
-        our_result = our_view.skip_ws()
-
-        assert our_result == discord_result, (
-            f"skip_ws() return value mismatch for input: {input_str!r}"
-        )
-        assert our_view.index == discord_view.index, (
-            f"index mismatch after skip_ws() for input: {input_str!r}"
-        )
-        assert our_view.eof == discord_view.eof, (
-            f"eof mismatch after skip_ws() for input: {input_str!r}"
-        )
-
-
-class TestReadRest:
-    """Test read_rest() method equivalence."""
-
-    @pytest.mark.parametrize("input_str", TEST_INPUTS)
-    def test_read_rest_equivalence(self, input_str: str) -> None:
-        """Test that read_rest() produces identical results."""
-        discord_view = DiscordStringView(input_str)
-        our_view = OurStringView(input_str)
-
-        discord_result = discord_view.read_rest()
-        our_result = our_view.read_rest()
-
-        assert our_result == discord_result, (
-            f"read_rest() mismatch for input: {input_str!r}"
-        )
-        assert our_view.index == discord_view.index, (
-            f"index mismatch after read_rest() for input: {input_str!r}"
-        )
-        assert our_view.eof == discord_view.eof, (
-            f"eof mismatch after read_rest() for input: {input_str!r}"
-        )
-
-
 class TestSequentialOperations:
     """Test sequences of operations to ensure stateful behavior matches."""
 
@@ -1,23 +1,22 @@
 from dataclasses import dataclass
-from typing import List
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Command:
     """Represents a parsed command"""
 
     cmd: str
-    args: List[str]
+    args: tuple[str, ...]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class JS:
     """Represents JavaScript code to execute"""
 
     code: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ListChildren:
     """Represents a request to list children of a command"""
 
@@ -0,0 +1,114 @@
+"""Tests for the development-mode command reloading in main."""
+
+import importlib
+from types import ModuleType
+from typing import Any, cast
+from unittest.mock import MagicMock
+
+import pytest
+from discord.ext import commands
+
+import emilybot.commands.run
+import emilybot.commands.show
+from emilybot.discord import EmilyBot
+from emilybot.main import (
+    _COMMANDS_DIR,  # pyright: ignore[reportPrivateUsage]
+    _dependencies_first,  # pyright: ignore[reportPrivateUsage]
+    _reload_command_modules,  # pyright: ignore[reportPrivateUsage]
+)
+
+
+def _module_importing(name: str, *imported_from: str) -> ModuleType:
+    """Create a module whose globals look like they were imported from other modules."""
+    module = ModuleType(name)
+    for i, source in enumerate(imported_from):
+        setattr(
+            module, f"imported_{i}", type(f"Imported{i}", (), {"__module__": source})
+        )
+    return module
+
+
+def test_dependencies_first_puts_run_after_show():
+    """Test that `run`, which imports helpers from `show`, is reloaded after it."""
+    run = emilybot.commands.run
+    show = emilybot.commands.show
+
+    assert _dependencies_first([run, show]) == [show, run]
+    assert _dependencies_first([show, run]) == [show, run]
+
+
+def test_dependencies_first_orders_chains():
+    """Test that transitive dependencies come before the modules using them."""
+    a = _module_importing("a", "b")
+    b = _module_importing("b", "c")
+    c = _module_importing("c")
+
+    assert _dependencies_first([a, b, c]) == [c, b, a]
+
+
+def test_dependencies_first_breaks_cycles():
+    """Test that an import cycle doesn't hang and keeps every module."""
+    a = _module_importing("a", "b", "c")
+    b = _module_importing("b", "a")
+    c = _module_importing("c")
+
+    ordered = _dependencies_first([a, b, c])
+
+    assert ordered[0] is c
+    assert sorted(m.__name__ for m in ordered) == ["a", "b", "c"]
+
+
+def test_reload_command_modules_ignores_non_command_files():
+    """Test that changes outside `emilybot/commands` ask for a full restart."""
+    bot = MagicMock(spec=EmilyBot)
+    command_file = str(_COMMANDS_DIR / "show.py")
+
+    assert not _reload_command_modules(cast(EmilyBot, bot), ["src/emilybot/main.py"])
+    assert not _reload_command_modules(
+        cast(EmilyBot, bot), [command_file, "config.toml"]
+    )
+    assert not _reload_command_modules(
+        cast(EmilyBot, bot), [str(_COMMANDS_DIR / "tests" / "test_show.py")]
+    )
+    bot.remove_command.assert_not_called()
+    bot.add_command.assert_not_called()
+
+
+def _reload_adding_command(module: ModuleType) -> ModuleType:
+    """Fake `importlib.reload` under which `show` gains a new command."""
+    if module is not emilybot.commands.show:
+        return module
+
+    async def cmd_new(ctx: Any) -> None:
+        pass
+
+    reloaded = ModuleType(module.__name__)
+    vars(reloaded).update(vars(module))
+    setattr(reloaded, "cmd_new", commands.Command(cmd_new, name="new"))
+    return reloaded
+
+
+def test_reload_command_modules_restarts_when_commands_change(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that a command module gaining a command asks for a full restart."""
+    monkeypatch.setattr(importlib, "reload", _reload_adding_command)
+    bot = MagicMock(spec=EmilyBot)
+
+    assert not _reload_command_modules(
+        cast(EmilyBot, bot), [str(_COMMANDS_DIR / "show.py")]
+    )
+
+
+def test_reload_command_modules_reregisters_commands(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that commands from reloaded modules replace the registered ones."""
+    monkeypatch.setattr(importlib, "reload", lambda module: module)
+    bot = MagicMock(spec=EmilyBot)
+
+    assert _reload_command_modules(
+        cast(EmilyBot, bot), [str(_COMMANDS_DIR / "show.py")]
+    )
+    bot.remove_command.assert_any_call("show")
+    bot.add_command.assert_any_call(emilybot.commands.show.cmd_show)
@@ -1,6 +1,6 @@
 """Validation utilities for Discord memory bot."""
 
-import re
+import string
 
 from emilybot.utils.inflect import inflect
 
@@ -15,6 +15,11 @@ class ValidationError(Exception):
 MIN_LENGTH = 2
 MAX_LENGTH = 100
 
+# Character classes for path components, checked with set operations instead
+# of regexes since this runs for every command name we parse
+_ALNUM_CHARS = frozenset(string.ascii_letters + string.digits)
+_COMPONENT_CHARS = _ALNUM_CHARS | {"_", "-"}
+
 
 def parse_path(path: str) -> list[str]:
     """
@@ -75,6 +80,9 @@ def validate_path(
         >>> validate_path("a", **({**_validate_defaults, "check_component_length": True}))  # doctest: +IGNORE_EXCEPTION_DETAIL
         Traceback (most recent call last):
         ValidationError: Path component must be at least no('character', 2) long
+        >>> validate_path("foo\\n", **_validate_defaults)  # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+        ValidationError: Path components must end with a letter or digit
         >>> validate_path("foo.bar", **({**_validate_defaults, "normalize_dots": True}))
         'foo/bar'
         >>> validate_path("foo-bar", **({**_validate_defaults, "normalize_dashes": True}))
@@ -124,31 +132,31 @@ def validate_path(
                 )
 
         # All components must start with a letter or digit
-        if not re.match(r"^[a-zA-Z0-9]", component):
+        if component[:1] not in _ALNUM_CHARS:
             raise ValidationError(
                 f"Command and subcommand names must start with a letter or digit, got {repr(component)}"
             )
 
         # All components must end with a letter or digit
-        if not re.match(r".*[a-zA-Z0-9]$", component):
+        if component[-1:] not in _ALNUM_CHARS:
             raise ValidationError(
                 f"Command and subcommand names must end with a letter or digit, got {repr(component)}"
             )
 
         # All components must contain only alphanumeric characters, underscores, or hyphens
-        if not re.match(r"^[a-zA-Z0-9_-]+$", component):
+        if not _COMPONENT_CHARS.issuperset(component):
             raise ValidationError(
                 f"Command and subcommand names can only contain letters, digits, underscores, or hyphens, got {repr(component)}"
             )
 
         # Component cannot be just a number
-        if re.match(r"^\d+$", component):
+        if component.isdigit():
             raise ValidationError(
                 f"Command and subcommand names cannot be just a number, got {repr(component)}"
             )
 
         # Only the first component can start with a number
-        if i > 0 and re.match(r"^\d", component):
+        if i > 0 and component[0].isdigit():
             raise ValidationError(
                 f"Subcommand names cannot start with a number, got {repr(component)}"
             )